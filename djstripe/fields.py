@@ -19,6 +19,10 @@ if USE_NATIVE_JSONFIELD:
 else:
     from jsonfield import JSONField as BaseJSONField
 
+# Cents in a major currency unit. Constructed once, since every decimal
+# currency amount synced from Stripe is divided by it.
+CENTS = decimal.Decimal("100")
+
 
 class StripeForeignKey(models.ForeignKey):
     setting_name = "DJSTRIPE_FOREIGN_KEY_TO_FIELD"
@@ -116,7 +120,7 @@ class StripeDecimalCurrencyAmountField(models.DecimalField):
 
         # Note: 0 is a possible return value, which is 'falseish'
         if val is not None:
-            return val / decimal.Decimal("100")
+            return val / CENTS
 
 
 class StripeEnumField(models.CharField):
@@ -4,6 +4,7 @@ dj-stripe model managers
 import decimal
 
 from django.db import models
+from django.utils import timezone
 
 
 class StripeModelManager(models.Manager):
@@ -15,6 +16,13 @@ class StripeModelManager(models.Manager):
 class SubscriptionManager(models.Manager):
     """Manager used in models.Subscription."""
 
+    def get_queryset(self):
+        """
+        Eagerly fetch the customer and plan, which are accessed whenever a
+        subscription is rendered (e.g. __str__), to avoid N+1 queries.
+        """
+        return super().get_queryset().select_related("customer", "plan")
+
     def started_during(self, year, month):
         """Return Subscriptions not in trial status between a certain time range."""
         return self.exclude(status="trialing").filter(
@@ -25,6 +33,16 @@ class SubscriptionManager(models.Manager):
         """Return active Subscriptions."""
         return self.filter(status="active")
 
+    def valid(self):
+        """
+        Return valid Subscriptions - the SQL equivalent of
+        ``Subscription.is_valid()`` (status and period are both current).
+        """
+        return self.filter(status__in=["trialing", "active"]).filter(
+            models.Q(current_period_end__gt=timezone.now())
+            | models.Q(trial_end__gt=timezone.now())
+        )
+
     def canceled(self):
         """Return canceled Subscriptions."""
         return self.filter(status="canceled")
@@ -80,9 +98,21 @@ class TransferManager(models.Manager):
         return self.during(year, month).aggregate(total_amount=models.Sum("amount"))
 
 
+class InvoiceManager(models.Manager):
+    """Manager used by models.Invoice."""
+
+    def get_queryset(self):
+        """Eagerly fetch the customer, which most invoice accesses touch."""
+        return super().get_queryset().select_related("customer")
+
+
 class ChargeManager(models.Manager):
     """Manager used by models.Charge."""
 
+    def get_queryset(self):
+        """Eagerly fetch the customer to avoid N+1 queries on charge lists."""
+        return super().get_queryset().select_related("customer")
+
     def during(self, year, month):
         """Return Charges between a certain time range based on `created`."""
         return self.filter(created__year=year, created__month=month)
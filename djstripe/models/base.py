@@ -139,7 +139,8 @@ class StripeModel(models.Model):
         for field in reverse_account_relations:
             # Grab the related object, using the first one we find.
             reverse_lookup_attr = field.get_accessor_name()
-            account = getattr(self, reverse_lookup_attr).first()
+            # Only the account ID is needed, so don't fetch the whole row.
+            account = getattr(self, reverse_lookup_attr).only("id").first()
 
             if account is not None:
                 return account.id
@@ -181,6 +182,12 @@ class StripeModel(models.Model):
 
         :returns: an iterator over all items in the query
         """
+        # Expand the same fields as api_retrieve() does, so that syncing the
+        # listed objects doesn't have to re-fetch each related object.
+        if cls.expand_fields:
+            kwargs.setdefault(
+                "expand", ["data.{}".format(field) for field in cls.expand_fields]
+            )
 
         return cls.stripe_class.list(api_key=api_key, **kwargs).auto_paging_iter()
 
@@ -700,7 +707,7 @@ class StripeModel(models.Model):
         """
         from .billing import TaxRate
 
-        pks = []
+        rows = []
 
         for tax_amount_data in data.get("total_tax_amounts", []):
             tax_rate_data = tax_amount_data["tax_rate"]
@@ -710,18 +717,51 @@ class StripeModel(models.Model):
             tax_rate, _ = TaxRate._get_or_create_from_stripe_object(
                 tax_rate_data, field_name="tax_rate", refetch=True
             )
-            tax_amount, _ = target_cls.objects.update_or_create(
-                invoice=instance,
-                tax_rate=tax_rate,
-                defaults={
-                    "amount": tax_amount_data["amount"],
-                    "inclusive": tax_amount_data["inclusive"],
-                },
-            )
-
-            pks.append(tax_amount.pk)
-
-        instance.total_tax_amounts.exclude(pk__in=pks).delete()
+            rows.append((tax_rate, tax_amount_data))
+
+        # Diff against the existing rows so the whole set is applied with at
+        # most one INSERT, one UPDATE and one DELETE, instead of one
+        # update_or_create round-trip per tax amount.
+        # The tax_rate FK's target field is configurable
+        # (DJSTRIPE_FOREIGN_KEY_TO_FIELD), so key on whatever it points at.
+        tax_rate_attname = target_cls._meta.get_field("tax_rate").target_field.attname
+        existing = {
+            tax_amount.tax_rate_id: tax_amount
+            for tax_amount in instance.total_tax_amounts.all()
+        }
+
+        to_create = []
+        to_update = []
+        for tax_rate, tax_amount_data in rows:
+            tax_amount = existing.get(getattr(tax_rate, tax_rate_attname))
+            if tax_amount is None:
+                to_create.append(
+                    target_cls(
+                        invoice=instance,
+                        tax_rate=tax_rate,
+                        amount=tax_amount_data["amount"],
+                        inclusive=tax_amount_data["inclusive"],
+                    )
+                )
+            elif (
+                tax_amount.amount != tax_amount_data["amount"]
+                or tax_amount.inclusive != tax_amount_data["inclusive"]
+            ):
+                tax_amount.amount = tax_amount_data["amount"]
+                tax_amount.inclusive = tax_amount_data["inclusive"]
+                to_update.append(tax_amount)
+
+        if to_create:
+            # (invoice, tax_rate) is unique_together, so a concurrent sync of
+            # the same invoice (e.g. a replayed webhook) can't insert dupes;
+            # ignore_conflicts makes the race lose silently instead of erroring.
+            target_cls.objects.bulk_create(to_create, ignore_conflicts=True)
+        if to_update:
+            target_cls.objects.bulk_update(to_update, ["amount", "inclusive"])
+
+        instance.total_tax_amounts.exclude(
+            tax_rate__in=[tax_rate for tax_rate, _ in rows]
+        ).delete()
 
     @classmethod
     def _stripe_object_to_invoice_items(cls, target_cls, data, invoice):
@@ -745,10 +785,13 @@ class StripeModel(models.Model):
         if not lines:
             return []
 
-        invoiceitems = []
-        for line in lines.auto_paging_iter():
+        # Don't save invoice items for ephemeral invoices
+        save = bool(invoice.id)
+
+        lines = list(lines.auto_paging_iter())
+
+        for line in lines:
             if invoice.id:
-                save = True
                 line.setdefault("invoice", invoice.id)
 
                 if line.get("type") == "subscription":
@@ -761,16 +804,23 @@ class StripeModel(models.Model):
                         line["id"] = "{invoice_id}-{subscription_id}".format(
                             invoice_id=invoice.id, subscription_id=line["id"]
                         )
-            else:
-                # Don't save invoice items for ephemeral invoices
-                save = False
 
             line.setdefault("customer", invoice.customer.id)
             line.setdefault("date", int(dateformat.format(invoice.created, "U")))
 
-            item, _ = target_cls._get_or_create_from_stripe_object(
-                line, refetch=False, save=save
-            )
+        # Fetch all existing invoice items in a single query, instead of
+        # issuing one SELECT per line item below.
+        existing_items = target_cls.stripe_objects.in_bulk(
+            [line["id"] for line in lines], field_name="id"
+        )
+
+        invoiceitems = []
+        for line in lines:
+            item = existing_items.get(line["id"])
+            if item is None:
+                item, _ = target_cls._get_or_create_from_stripe_object(
+                    line, refetch=False, save=save
+                )
             invoiceitems.append(item)
 
         return invoiceitems
@@ -795,12 +845,22 @@ class StripeModel(models.Model):
             subscription.items.delete()
             return []
 
+        items = list(items.auto_paging_iter())
+
+        # Fetch all existing subscription items in a single query, instead
+        # of issuing one SELECT per item below.
+        existing_items = target_cls.stripe_objects.in_bulk(
+            [item_data["id"] for item_data in items], field_name="id"
+        )
+
         pks = []
         subscriptionitems = []
-        for item_data in items.auto_paging_iter():
-            item, _ = target_cls._get_or_create_from_stripe_object(
-                item_data, refetch=False
-            )
+        for item_data in items:
+            item = existing_items.get(item_data["id"])
+            if item is None:
+                item, _ = target_cls._get_or_create_from_stripe_object(
+                    item_data, refetch=False
+                )
             pks.append(item.pk)
             subscriptionitems.append(item)
         subscription.items.exclude(pk__in=pks).delete()
@@ -824,11 +884,21 @@ class StripeModel(models.Model):
         if not refunds:
             return []
 
+        refunds = list(refunds.auto_paging_iter())
+
+        # Fetch all existing refunds in a single query, instead of issuing
+        # one SELECT per refund below.
+        existing_refunds = target_cls.stripe_objects.in_bulk(
+            [refund_data["id"] for refund_data in refunds], field_name="id"
+        )
+
         refund_objs = []
-        for refund_data in refunds.auto_paging_iter():
-            item, _ = target_cls._get_or_create_from_stripe_object(
-                refund_data, refetch=False
-            )
+        for refund_data in refunds:
+            item = existing_refunds.get(refund_data["id"])
+            if item is None:
+                item, _ = target_cls._get_or_create_from_stripe_object(
+                    refund_data, refetch=False
+                )
             refund_objs.append(item)
 
         return refund_objs
@@ -22,7 +22,7 @@ from ..fields import (
     StripePercentField,
     StripeQuantumCurrencyAmountField,
 )
-from ..managers import SubscriptionManager
+from ..managers import InvoiceManager, SubscriptionManager
 from ..utils import QuerySetMock, get_friendly_currency_amount
 from .base import StripeModel
 
@@ -738,6 +738,8 @@ class Invoice(BaseInvoice):
         help_text="The tax rates applied to this invoice, if any.",
     )
 
+    objects = InvoiceManager()
+
     def _attach_objects_post_save_hook(self, cls, data, pending_relations=None):
         super()._attach_objects_post_save_hook(
             cls, data, pending_relations=pending_relations
@@ -1589,7 +1591,7 @@ class Subscription(StripeModel):
         false otherwise.
         """
 
-        return self.status in ["trialing", "active"]
+        return self.status in {"trialing", "active"}
 
     def is_status_temporarily_current(self):
         """
@@ -1604,9 +1606,11 @@ class Subscription(StripeModel):
         subscription is temporarily current.
         """
 
+        # Check the cheap boolean flag first so the common (not canceling)
+        # case short-circuits before any datetime work.
         return (
-            self.canceled_at
-            and self.cancel_at_period_end
+            self.cancel_at_period_end
+            and self.canceled_at is not None
             and timezone.now() < self.current_period_end
         )
 
@@ -368,7 +368,8 @@ class Charge(StripeModel):
     @property
     def fraudulent(self) -> bool:
         return (
-            self.fraud_details and list(self.fraud_details.values())[0] == "fraudulent"
+            bool(self.fraud_details)
+            and next(iter(self.fraud_details.values())) == "fraudulent"
         )
 
     def _attach_objects_hook(self, cls, data, current_ids=None):
@@ -1039,8 +1040,8 @@ class Customer(StripeModel):
 
         # Remove sources
         self.default_source = None
-        for source in self.legacy_cards.all():
-            source.remove()
+
+        self._purge_legacy_cards()
 
         for source in self.sources.all():
             source.detach()
@@ -1048,6 +1049,31 @@ class Customer(StripeModel):
         self.date_purged = timezone.now()
         self.save()
 
+    def _purge_legacy_cards(self):
+        """Delete this customer's legacy cards, remotely and then locally."""
+
+        # Snapshot the cards up front and delete them in one query afterwards,
+        # instead of issuing one DELETE per card via Card.remove().
+        cards = list(self.legacy_cards.all())
+        for card in cards:
+            try:
+                card._api_delete()
+            except InvalidRequestError as exc:
+                if "No such source:" in str(exc) or "No such customer:" in str(exc):
+                    # The exception was thrown because the stripe customer or
+                    # card was already deleted on the stripe side,
+                    # ignore the exception
+                    pass
+                else:
+                    # The exception was raised for another reason, re-raise it
+                    raise
+
+        if cards:
+            Customer.objects.filter(
+                default_source__in=[card.id for card in cards]
+            ).update(default_source=None)
+            self.legacy_cards.filter(pk__in=[card.pk for card in cards]).delete()
+
     # TODO: Override Queryset.delete() with a custom manager,
     #  since this doesn't get called in bulk deletes
     #  (or cascades, but that's another matter)
@@ -1064,11 +1090,9 @@ class Customer(StripeModel):
     def _get_valid_subscriptions(self):
         """ Get a list of this customer's valid subscriptions."""
 
-        return [
-            subscription
-            for subscription in self.subscriptions.all()
-            if subscription.is_valid()
-        ]
+        # Filter in SQL rather than fetching every subscription and
+        # calling is_valid() on each.
+        return list(self.subscriptions.valid())
 
     def is_subscribed_to(self, product: Union[Product, str]) -> bool:
         """
@@ -1096,7 +1120,7 @@ class Customer(StripeModel):
         :returns: True if there exists an active subscription, False otherwise.
         """
 
-        return len(self._get_valid_subscriptions()) != 0
+        return self.subscriptions.valid().exists()
 
     @property
     def active_subscriptions(self):
@@ -1134,15 +1158,19 @@ class Customer(StripeModel):
             In this case, use ``Customer.subscriptions`` instead.
         """
 
-        subscriptions = self.valid_subscriptions
+        # Fetch at most two rows in a single query - enough to distinguish
+        # the zero/one/many cases without a separate COUNT query.
+        subscriptions = list(self.valid_subscriptions.order_by("pk")[:2])
 
-        if subscriptions.count() > 1:
+        if len(subscriptions) > 1:
             raise MultipleSubscriptionException(
                 "This customer has multiple subscriptions. Use Customer.subscriptions "
                 "to access them."
             )
+        elif subscriptions:
+            return subscriptions[0]
         else:
-            return subscriptions.first()
+            return None
 
     def can_charge(self):
         """Determines if this customer is able to be charged."""
@@ -1,6 +1,6 @@
 import json
 import warnings
-from traceback import format_exc
+from traceback import format_exception
 
 import stripe
 from django.db import models
@@ -102,7 +102,12 @@ class WebhookEventTrigger(models.Model):
         except Exception as e:
             max_length = WebhookEventTrigger._meta.get_field("exception").max_length
             obj.exception = str(e)[:max_length]
-            obj.traceback = format_exc()
+            # Cap the stack walk so a deep recursion error doesn't balloon
+            # the stored traceback; a negative limit keeps the innermost
+            # frames, i.e. the ones around the actual raise site.
+            obj.traceback = "".join(
+                format_exception(type(e), e, e.__traceback__, limit=-20)
+            )
 
             # Send the exception as the webhook_processing_error signal
             webhook_processing_error.send(
@@ -187,6 +192,16 @@ class WebhookEventTrigger(models.Model):
         self.event = Event.process(self.json_body)
         self.processed = True
         if save:
-            self.save()
+            # Only write the fields process() touches ("updated" is auto_now),
+            # rather than a full-row UPDATE per webhook.
+            self.save(
+                update_fields=[
+                    "exception",
+                    "traceback",
+                    "event",
+                    "processed",
+                    "updated",
+                ]
+            )
 
         return self.event
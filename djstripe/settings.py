@@ -1,6 +1,8 @@
 """
 dj-stripe settings
 """
+from functools import lru_cache
+
 import stripe
 from django.apps import apps as django_apps
 from django.conf import settings
@@ -162,19 +164,14 @@ def get_subscriber_model_string():
     return getattr(settings, "DJSTRIPE_SUBSCRIBER_MODEL", settings.AUTH_USER_MODEL)
 
 
-def get_subscriber_model():
+@lru_cache(maxsize=None)
+def _get_subscriber_model(model_name):
     """
-    Attempt to pull settings.DJSTRIPE_SUBSCRIBER_MODEL.
-
-    Users have the option of specifying a custom subscriber model via the
-    DJSTRIPE_SUBSCRIBER_MODEL setting.
-
-    This methods falls back to AUTH_USER_MODEL if DJSTRIPE_SUBSCRIBER_MODEL is not set.
+    Resolve and validate the subscriber model for a given model name.
 
-    Returns the subscriber model that is active in this project.
+    Memoized on the model name, so a changed DJSTRIPE_SUBSCRIBER_MODEL
+    setting can never return a stale model.
     """
-    model_name = get_subscriber_model_string()
-
     # Attempt a Django 1.7 app lookup
     try:
         subscriber_model = django_apps.get_model(model_name)
@@ -188,13 +185,30 @@ def get_subscriber_model():
             "that has not been installed.".format(model=model_name)
         )
 
-    if (
-        "email" not in [field_.name for field_ in subscriber_model._meta.get_fields()]
+    if not any(
+        field_.name == "email" for field_ in subscriber_model._meta.get_fields()
     ) and not hasattr(subscriber_model, "email"):
         raise ImproperlyConfigured(
             "DJSTRIPE_SUBSCRIBER_MODEL must have an email attribute."
         )
 
+    return subscriber_model
+
+
+def get_subscriber_model():
+    """
+    Attempt to pull settings.DJSTRIPE_SUBSCRIBER_MODEL.
+
+    Users have the option of specifying a custom subscriber model via the
+    DJSTRIPE_SUBSCRIBER_MODEL setting.
+
+    This methods falls back to AUTH_USER_MODEL if DJSTRIPE_SUBSCRIBER_MODEL is not set.
+
+    Returns the subscriber model that is active in this project.
+    """
+    model_name = get_subscriber_model_string()
+    subscriber_model = _get_subscriber_model(model_name)
+
     if model_name != settings.AUTH_USER_MODEL:
         # Custom user model detected. Make sure the callback is configured.
         func = get_callback_function("DJSTRIPE_SUBSCRIBER_MODEL_REQUEST_CALLBACK")
@@ -231,6 +231,93 @@ class InvoiceTest(AssertStripeFksMixin, TestCase):
             invoice_updated, expected_blank_fks=self.default_expected_blank_fks
         )
 
+    @patch(
+        "djstripe.models.Account.get_default_account",
+        autospec=IS_STATICMETHOD_AUTOSPEC_SUPPORTED,
+    )
+    @patch(
+        "stripe.BalanceTransaction.retrieve",
+        return_value=deepcopy(FAKE_BALANCE_TRANSACTION),
+        autospec=True,
+    )
+    @patch(
+        "stripe.Subscription.retrieve",
+        return_value=deepcopy(FAKE_SUBSCRIPTION),
+        autospec=True,
+    )
+    @patch("stripe.Charge.retrieve", return_value=deepcopy(FAKE_CHARGE), autospec=True)
+    @patch(
+        "stripe.PaymentMethod.retrieve",
+        return_value=deepcopy(FAKE_CARD_AS_PAYMENT_METHOD),
+        autospec=True,
+    )
+    @patch(
+        "stripe.PaymentIntent.retrieve",
+        return_value=deepcopy(FAKE_PAYMENT_INTENT_I),
+        autospec=True,
+    )
+    @patch(
+        "stripe.Product.retrieve", return_value=deepcopy(FAKE_PRODUCT), autospec=True
+    )
+    def test_sync_from_stripe_data_amend_and_remove_total_tax_amounts(
+        self,
+        product_retrieve_mock,
+        payment_intent_retrieve_mock,
+        paymentmethod_card_retrieve_mock,
+        charge_retrieve_mock,
+        subscription_retrieve_mock,
+        balance_transaction_retrieve_mock,
+        default_account_mock,
+    ):
+        default_account_mock.return_value = self.account
+
+        # Sync an invoice with two tax amounts
+        fake_invoice = deepcopy(FAKE_INVOICE)
+        fake_tax_rate_2 = deepcopy(FAKE_TAX_RATE_EXAMPLE_2_SALES)
+
+        fake_invoice["default_tax_rates"] = fake_invoice["default_tax_rates"] + [
+            fake_tax_rate_2
+        ]
+        fake_invoice["total_tax_amounts"] = fake_invoice["total_tax_amounts"] + [
+            {
+                "amount": 100,
+                "inclusive": False,
+                "tax_rate": fake_tax_rate_2["id"],
+            }
+        ]
+
+        invoice = Invoice.sync_from_stripe_data(fake_invoice)
+
+        self.assertEqual(invoice.total_tax_amounts.count(), 2)
+
+        # Re-sync with the second tax rate removed and the amount of the
+        # remaining one changed
+        fake_updated_invoice = deepcopy(FAKE_INVOICE)
+        fake_updated_invoice["total_tax_amounts"] = [
+            {
+                "amount": 300,
+                "inclusive": FAKE_TAX_RATE_EXAMPLE_1_VAT["inclusive"],
+                "tax_rate": FAKE_TAX_RATE_EXAMPLE_1_VAT["id"],
+            }
+        ]
+
+        invoice_updated = Invoice.sync_from_stripe_data(fake_updated_invoice)
+
+        # The stale row is deleted and the remaining one carries the new amount
+        self.assertEqual(invoice_updated.total_tax_amounts.count(), 1)
+
+        first_tax_amount = invoice_updated.total_tax_amounts.first()
+        self.assertEqual(
+            first_tax_amount.tax_rate.id, FAKE_TAX_RATE_EXAMPLE_1_VAT["id"]
+        )
+        self.assertEqual(
+            first_tax_amount.inclusive, FAKE_TAX_RATE_EXAMPLE_1_VAT["inclusive"]
+        )
+        self.assertEqual(first_tax_amount.amount, 300)
+        self.assert_fks(
+            invoice_updated, expected_blank_fks=self.default_expected_blank_fks
+        )
+
     @patch(
         "djstripe.models.Account.get_default_account",
         autospec=IS_STATICMETHOD_AUTOSPEC_SUPPORTED,
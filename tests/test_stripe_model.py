@@ -107,8 +107,8 @@ def test_api_retrieve_reverse_foreign_key_lookup(mock_stripe_class, mock__meta):
     # Set up a mock account for the reverse foreign key query to return.
     mock_account = MagicMock()
     mock_account_reverse_manager = MagicMock()
-    # Make first return the mock account.
-    mock_account_reverse_manager.first.return_value = mock_account
+    # Make only("id").first() return the mock account.
+    mock_account_reverse_manager.only.return_value.first.return_value = mock_account
 
     test_model = StripeModel()
     mock_id = "id_fakefakefakefake01"
@@ -125,4 +125,5 @@ def test_api_retrieve_reverse_foreign_key_lookup(mock_stripe_class, mock__meta):
         id=mock_id, api_key=mock_api_key, stripe_account=mock_account.id, expand=[]
     )
     mock_reverse_foreign_key.get_accessor_name.assert_called_once_with()
-    mock_account_reverse_manager.first.assert_called_once_with()
+    mock_account_reverse_manager.only.assert_called_once_with("id")
+    mock_account_reverse_manager.only.return_value.first.assert_called_once_with()